@@ -1,3 +1,5 @@
+import { XML_SPECIAL_CHARS_RE, XML_ESCAPES } from './map-utils.js';
+
 export class KMLConverter {
     static async kmlToGeoJson(kmlString) {
         const parser = new DOMParser();
@@ -334,12 +336,7 @@ export class KMLConverter {
     }
 
     static _escapeXml(str) {
-        return String(str)
-            .replace(/&/g, '&amp;')
-            .replace(/</g, '&lt;')
-            .replace(/>/g, '&gt;')
-            .replace(/"/g, '&quot;')
-            .replace(/'/g, '&apos;');
+        return String(str).replace(XML_SPECIAL_CHARS_RE, char => XML_ESCAPES[char]);
     }
 
     static isKmlUrl(url) {
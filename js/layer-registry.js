@@ -11,10 +11,12 @@ export class LayerRegistry {
         if (this._initialized) return;
 
         // Load all atlas configurations
-        let atlasConfigs = [window.amche.DEFAULT_ATLAS.slice(window.amche.DEFAULT_ATLAS.indexOf('config/') + 7, window.amche.DEFAULT_ATLAS.indexOf('.atlas.json'))];
+        const defaultAtlasId = window.amche.DEFAULT_ATLAS.slice(window.amche.DEFAULT_ATLAS.indexOf('config/') + 7, window.amche.DEFAULT_ATLAS.indexOf('.atlas.json'));
+        let atlasConfigs = [defaultAtlasId];
+        let indexConfig = null;
         const indexResponse = await fetch(window.amche.DEFAULT_ATLAS);
         if (indexResponse.ok) {
-            const indexConfig = await indexResponse.json();
+            indexConfig = await indexResponse.json();
             if (indexConfig.atlases && Array.isArray(indexConfig.atlases)) {
                 atlasConfigs = atlasConfigs.concat(indexConfig.atlases);
             }
@@ -25,6 +27,11 @@ export class LayerRegistry {
 
         // Load all atlas configurations in parallel
         const atlasPromises = atlasConfigs.map(async (atlasId) => {
+            // The default atlas doubles as the atlas index and has already been loaded
+            if (atlasId === defaultAtlasId && indexConfig) {
+                return { atlasId, config: indexConfig, success: true };
+            }
+
             try {
                 const response = await fetch(`config/${atlasId}.atlas.json`);
                 if (response.ok) {
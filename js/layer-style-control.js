@@ -127,7 +127,6 @@ export class LayerStyleControl {
      */
     _collectStyleProperties(layerIds, config) {
         const properties = {};
-        const debugInfo = { collected: [], filtered: [] };
 
         // Get common paint properties based on layer type
         const commonProperties = this._getCommonProperties(config);
@@ -152,9 +151,6 @@ export class LayerStyleControl {
                                 layerType: layerType,
                                 mapLayerId: mapLayerId
                             };
-                            debugInfo.collected.push({ prop, value, type: 'paint' });
-                        } else {
-                            debugInfo.filtered.push({ prop, value, type: 'paint', reason: 'not editable' });
                         }
                     }
                 });
@@ -173,7 +169,6 @@ export class LayerStyleControl {
                                 mapLayerId: mapLayerId,
                                 fromConfig: true
                             };
-                            debugInfo.collected.push({ prop, value, type: 'paint', source: 'config' });
                         }
                     }
                 });
@@ -193,9 +188,6 @@ export class LayerStyleControl {
                                 layerType: layerType,
                                 mapLayerId: mapLayerId
                             };
-                            debugInfo.collected.push({ prop, value, type: 'layout' });
-                        } else {
-                            debugInfo.filtered.push({ prop, value, type: 'layout', reason: 'not editable' });
                         }
                     }
                 });
@@ -214,14 +206,12 @@ export class LayerStyleControl {
                                 mapLayerId: mapLayerId,
                                 fromConfig: true
                             };
-                            debugInfo.collected.push({ prop, value, type: 'layout', source: 'config' });
                         }
                     }
                 });
             }
         });
 
-        console.log('[LayerStyleControl] Property collection:', debugInfo);
         return properties;
     }
 
@@ -2861,15 +2861,11 @@ export class MapExportControl {
         const layerId = layerConfig.id;
         const matchingIds = [];
 
-        // Strategy 1: Direct ID match (HIGHEST PRIORITY)
-        const directMatches = style.layers.filter(l => l.id === layerId).map(l => l.id);
-        matchingIds.push(...directMatches);
-
-        // Strategy 2: Prefix matches (for geojson layers and others)
-        const prefixMatches = style.layers
-            .filter(l => l.id.startsWith(layerId + '-') || l.id.startsWith(layerId + ' '))
+        // Strategy 1 & 2: Exact ID and prefix matches (for geojson layers and others), in style layer order
+        const idMatches = style.layers
+            .filter(l => l.id === layerId || l.id.startsWith(layerId + '-') || l.id.startsWith(layerId + ' '))
             .map(l => l.id);
-        matchingIds.push(...prefixMatches);
+        matchingIds.push(...idMatches);
 
         // Strategy 3: Generated layer names (vector-layer-{id}, tms-layer-{id}, etc.)
         const generatedMatches = style.layers
@@ -2893,7 +2889,7 @@ export class MapExportControl {
         }
 
         // Strategy 5: Source layer matches (only if no direct matches)
-        const hasDirectMatches = directMatches.length > 0 || prefixMatches.length > 0 || generatedMatches.length > 0;
+        const hasDirectMatches = idMatches.length > 0 || generatedMatches.length > 0;
         if (!hasDirectMatches && layerConfig.sourceLayer) {
             const sourceLayerMatches = style.layers
                 .filter(l => {
@@ -2263,10 +2263,10 @@ export class MapFeatureControl {
         // Choose link color based on theme
         const linkColor = isDarkTheme ? '#60a5fa' : '#2563eb'; // Lighter blue for dark theme, darker blue for light theme
 
-        parts.forEach(part => {
-            // Check if part matches URL pattern without using test() to avoid regex state issues
-            const urlMatch = part.match(/^(https?:\/\/[^\s]+|www\.[^\s]+)$/i);
-            if (urlMatch) {
+        parts.forEach((part, index) => {
+            // split() with a capturing group alternates text and captured URLs,
+            // so odd indices are URLs and need no second regex check
+            if (index % 2 === 1) {
                 // This is a URL - create a clickable link
                 const link = document.createElement('a');
                 let href = part;
@@ -4299,18 +4299,14 @@ export class MapFeatureControl {
         const layerId = layerConfig.id;
         const matchingIds = [];
 
-        // Strategy 1: Direct ID match (HIGHEST PRIORITY)
-        const directMatches = style.layers.filter(l => l.id === layerId).map(l => l.id);
-        matchingIds.push(...directMatches);
-
-        // Strategy 2: Prefix matches (for geojson layers and others)
-        const prefixMatches = style.layers
-            .filter(l => l.id.startsWith(layerId + '-') || l.id.startsWith(layerId + ' '))
+        // Strategy 1 & 2: Exact ID and prefix matches (for geojson layers and others), in style layer order
+        const idMatches = style.layers
+            .filter(l => l.id === layerId || l.id.startsWith(layerId + '-') || l.id.startsWith(layerId + ' '))
             .map(l => l.id);
-        matchingIds.push(...prefixMatches);
+        matchingIds.push(...idMatches);
 
-        // If we have direct matches, prioritize them and be more restrictive with fallback strategies
-        const hasDirectMatches = directMatches.length > 0 || prefixMatches.length > 0;
+        // If we have ID matches, prioritize them and be more restrictive with fallback strategies
+        const hasDirectMatches = idMatches.length > 0;
 
         // Strategy 3: Source layer matches with additional layer ID filtering (ONLY if no direct matches found)
         // This prevents cross-matches when multiple configs share the same sourceLayer
@@ -4370,26 +4366,18 @@ export class MapFeatureControl {
         if (layerConfig.type === 'geojson') {
             const sourceId = `geojson-${layerId}`;
 
-            // Check for source match
-            const geojsonSourceMatches = style.layers
-                .filter(l => l.source === sourceId)
-                .map(l => l.id);
-            matchingIds.push(...geojsonSourceMatches);
-
-            // Check for specific geojson layer patterns
-            const geojsonLayerPatterns = [
+            // Check for source match and specific geojson layer patterns in one pass
+            const geojsonLayerPatterns = new Set([
                 `${sourceId}-fill`,
                 `${sourceId}-line`,
                 `${sourceId}-circle`,
                 `${sourceId}-symbol`
-            ];
+            ]);
 
-            geojsonLayerPatterns.forEach(pattern => {
-                const patternMatches = style.layers
-                    .filter(l => l.id === pattern)
-                    .map(l => l.id);
-                matchingIds.push(...patternMatches);
-            });
+            const geojsonMatches = style.layers
+                .filter(l => l.source === sourceId || geojsonLayerPatterns.has(l.id))
+                .map(l => l.id);
+            matchingIds.push(...geojsonMatches);
         }
 
         // Strategy 8: CSV layer matching
@@ -4404,23 +4392,16 @@ export class MapFeatureControl {
         // Strategy 9: Vector layer matching (enhanced)
         if (layerConfig.type === 'vector') {
             const sourceId = `vector-${layerId}`;
-            const vectorSourceMatches = style.layers
-                .filter(l => l.source === sourceId)
-                .map(l => l.id);
-            matchingIds.push(...vectorSourceMatches);
-
-            const vectorLayerPatterns = [
+            const vectorLayerPatterns = new Set([
                 `vector-layer-${layerId}`,
                 `vector-layer-${layerId}-outline`,
                 `vector-layer-${layerId}-text`
-            ];
+            ]);
 
-            vectorLayerPatterns.forEach(pattern => {
-                const patternMatches = style.layers
-                    .filter(l => l.id === pattern)
-                    .map(l => l.id);
-                matchingIds.push(...patternMatches);
-            });
+            const vectorMatches = style.layers
+                .filter(l => l.source === sourceId || vectorLayerPatterns.has(l.id))
+                .map(l => l.id);
+            matchingIds.push(...vectorMatches);
         }
 
         // Strategy 10: TMS layer matching
@@ -755,15 +755,11 @@ export class MapFeatureStateManager extends EventTarget {
         const layerId = layerConfig.id;
         const matchingIds = [];
 
-        // Strategy 1: Direct ID match (HIGHEST PRIORITY)
-        const directMatches = style.layers.filter(l => l.id === layerId).map(l => l.id);
-        matchingIds.push(...directMatches);
-
-        // Strategy 2: Prefix matches (for geojson layers and others)
-        const prefixMatches = style.layers
-            .filter(l => l.id.startsWith(layerId + '-') || l.id.startsWith(layerId + ' '))
+        // Strategy 1 & 2: Exact ID and prefix matches (for geojson layers and others), in style layer order
+        const idMatches = style.layers
+            .filter(l => l.id === layerId || l.id.startsWith(layerId + '-') || l.id.startsWith(layerId + ' '))
             .map(l => l.id);
-        matchingIds.push(...prefixMatches);
+        matchingIds.push(...idMatches);
 
         // Strategy 2.5: MapboxAPI generated layer names (vector-layer-{id}, tms-layer-{id}, wmts-layer-{id}, wms-layer-{id}, etc.)
         const generatedMatches = style.layers
@@ -784,7 +780,7 @@ export class MapFeatureStateManager extends EventTarget {
         matchingIds.push(...styleLayerMatches);
 
         // If we have direct matches, prioritize them and be more restrictive with fallback strategies
-        const hasDirectMatches = directMatches.length > 0 || prefixMatches.length > 0 || generatedMatches.length > 0 || styleLayerMatches.length > 0;
+        const hasDirectMatches = idMatches.length > 0 || generatedMatches.length > 0 || styleLayerMatches.length > 0;
 
         // Strategy 3: Source layer matches (ONLY if no direct matches found)
         if (!hasDirectMatches && layerConfig.sourceLayer) {
@@ -231,6 +231,15 @@ export class MapInitializer {
             const validLayers = [];
             const invalidLayers = [];
 
+            // Start cross-config lookups for layers missing from the registry up front,
+            // so their config fetches run concurrently instead of one after another
+            const crossConfigLookups = new Map();
+            for (const layerConfig of config.layers) {
+                if (layerConfig.id && !layerConfig.type && !layerRegistry.getLayer(layerConfig.id, atlasId)) {
+                    crossConfigLookups.set(layerConfig, layerRegistry.tryLoadCrossConfigLayer(layerConfig.id, layerConfig));
+                }
+            }
+
             // Process layers one by one
             for (const layerConfig of config.layers) {
                 // If the layer only has an id (or minimal properties), look it up using the registry
@@ -239,10 +248,9 @@ export class MapInitializer {
                     // This handles both current atlas layers and cross-atlas references
                     let resolvedLayer = layerRegistry.getLayer(layerConfig.id, atlasId);
 
-                    // If not found in primary registry, try cross-config loading
+                    // If not found in primary registry, use the cross-config lookup started above
                     if (!resolvedLayer) {
-                        // Using the new method on layerRegistry
-                        resolvedLayer = await layerRegistry.tryLoadCrossConfigLayer(layerConfig.id, layerConfig);
+                        resolvedLayer = await crossConfigLookups.get(layerConfig);
                     }
 
                     if (resolvedLayer) {
@@ -251,12 +259,6 @@ export class MapInitializer {
                             console.warn(`[LayerRegistry] Resolved layer ${layerConfig.id} from registry is missing type property. Registry entry:`, resolvedLayer);
                         }
 
-                        // Debug: Check proxy settings before merge
-                        if (layerConfig.id && layerConfig.id.includes('bhuvan')) {
-                            console.log(`[DEBUG] Before merge - layerConfig:`, { id: layerConfig.id, hasProxyUrl: !!layerConfig.proxyUrl, opacity: layerConfig.opacity });
-                            console.log(`[DEBUG] Before merge - resolvedLayer:`, { id: resolvedLayer.id, hasProxyUrl: !!resolvedLayer.proxyUrl, proxyUrl: resolvedLayer.proxyUrl, proxyReferer: resolvedLayer.proxyReferer });
-                        }
-
                         // Merge the resolved layer with any custom overrides from config
                         // Preserve important URL-specific properties
                         // Note: layerConfig is spread after resolvedLayer, so it can override properties
@@ -283,11 +285,6 @@ export class MapInitializer {
                             _normalizedId: layerRegistry.normalizeLayerId(layerConfig.id, atlasId)
                         };
 
-                        // Debug: Check proxy settings after merge
-                        if (layerConfig.id && layerConfig.id.includes('bhuvan')) {
-                            console.log(`[DEBUG] After merge:`, { id: mergedLayer.id, hasProxyUrl: !!mergedLayer.proxyUrl, proxyUrl: mergedLayer.proxyUrl, proxyReferer: mergedLayer.proxyReferer });
-                        }
-
                         // Verify the merge preserved important properties
                         if (!mergedLayer.title) {
                             console.warn(`[LayerRegistry] Cross-atlas layer ${layerConfig.id} from ${resolvedLayer._sourceAtlas} atlas missing title after merge (this is unusual)`);
@@ -168,15 +168,20 @@ export class MapLayerControl {
      */
     async _loadDefaultStyles() {
         try {
-            const defaultsResponse = await fetch(window.amche.LAYER_DEFAULTS);
-            const configResponse = await fetch(window.amche.DEFAULT_ATLAS);
+            // The two files are independent, so fetch them concurrently
+            const [defaultsResponse, configResponse] = await Promise.all([
+                fetch(window.amche.LAYER_DEFAULTS),
+                fetch(window.amche.DEFAULT_ATLAS)
+            ]);
 
             if (!defaultsResponse.ok || !configResponse.ok) {
                 throw new Error('Failed to load configuration files');
             }
 
-            const defaults = await defaultsResponse.json();
-            const config = await configResponse.json();
+            const [defaults, config] = await Promise.all([
+                defaultsResponse.json(),
+                configResponse.json()
+            ]);
 
             this._defaultStyles = defaults.layer.style || {};
             if (config.styles) {
@@ -2,6 +2,24 @@
  * Utility classes for data manipulation, geographic conversions, URL handling, and map operations.
  */
 
+const MS_PER_DAY = 1000 * 60 * 60 * 24;
+
+// Patterns used per row/cell when converting CSV rows to GeoJSON
+const COORDINATE_RE = /-?\d+(\.\d+)?/;
+
+// Integer, dot-decimal or comma-decimal; group 1 captures the decimal separator
+const NUMERIC_RE = /^-?\d+(?:([.,])\d+)?$/;
+
+// XML special characters and their entity replacements, applied in a single pass
+export const XML_SPECIAL_CHARS_RE = /[&<>"']/g;
+export const XML_ESCAPES = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&apos;'
+};
+
 export class DataUtils {
     /**
      * Checks if an item is a plain object (not null, not array, not function)
@@ -43,17 +61,21 @@ export class DataUtils {
     static gstableToArray(tableData) {
         const { cols, rows } = tableData;
         const headers = cols.map(col => col.label);
+        // Work out which columns hold timestamps once, rather than for every cell
+        const isTimestampColumn = headers.map(header =>
+            typeof header === 'string' && header.toLowerCase().includes('timestamp'));
+        // Measure every timestamp against the same reference time
+        const now = new Date();
         const result = rows.map(row => {
             const obj = {};
             row.c.forEach((cell, index) => {
                 const key = headers[index];
                 obj[key] = cell ? cell.v : null;
-                if (cell && cell.v && key.toLowerCase().includes('timestamp')) {
+                if (cell && cell.v && isTimestampColumn[index]) {
                     let timestamp = new Date(...cell.v.match(/\d+/g).map((v, i) => i === 1 ? +v - 1 : +v));
                     timestamp = timestamp.setMonth(timestamp.getMonth() + 1)
-                    const now = new Date();
                     const diffTime = Math.abs(now - timestamp);
-                    const diffDays = Math.floor(diffTime / (1000 * 60 * 60 * 24));
+                    const diffDays = Math.floor(diffTime / MS_PER_DAY);
                     let daysAgoText;
                     if (diffDays === 0) {
                         daysAgoText = 'Today';
@@ -77,63 +99,105 @@ export class DataUtils {
      */
     static parseCSV(csvText) {
         if (!csvText) return [];
-        const lines = csvText.split(/\r?\n/).filter(line => line.trim().length > 0);
-        if (lines.length === 0) return [];
-
-        let headerLine = lines[0];
-        let dataStartIndex = 1;
-        const headers = this.parseCSVLine(headerLine);
-
-        for (let i = 1; i < lines.length; i++) {
-            const currentLine = this.parseCSVLine(lines[i]);
-            if (currentLine.length === headers.length &&
-                currentLine.every((val, idx) => val.trim() === headers[idx].trim())) {
-                dataStartIndex = i + 1;
-            } else {
-                break;
-            }
-        }
 
+        let headers = null;
+        let skippingRepeatedHeaders = true;
         const rows = [];
-        for (let i = dataStartIndex; i < lines.length; i++) {
-            const values = this.parseCSVLine(lines[i]);
+        for (const values of this.parseCSVRecords(csvText)) {
+            // Blank lines carry no data
+            if (values.length === 1 && values[0].trim().length === 0) continue;
+
+            if (!headers) {
+                headers = values.map(header => header.trim());
+                continue;
+            }
+
+            // Some exports repeat the header line; skip copies directly after the first
+            if (skippingRepeatedHeaders) {
+                if (values.length === headers.length &&
+                    values.every((val, idx) => val.trim() === headers[idx])) {
+                    continue;
+                }
+                skippingRepeatedHeaders = false;
+            }
+
             if (values.length !== headers.length) continue;
             const row = {};
-            headers.forEach((header, index) => {
-                row[header.trim()] = values[index];
-            });
+            for (let j = 0; j < headers.length; j++) {
+                row[headers[j]] = values[j];
+            }
             rows.push(row);
         }
         return rows;
     }
 
     /**
-     * Parses a single CSV line respecting quoted fields with commas
-     * @param {string} line - A single line of CSV text
-     * @returns {Array} Array of field values
+     * Splits CSV text into records of field values (RFC 4180), so quoted
+     * fields may contain commas, escaped quotes ("") and line breaks
+     * @param {string} csvText - Raw CSV text
+     * @returns {Array<Array<string>>} Array of records, each an array of field values
+     */
+    static parseCSVRecords(csvText) {
+        const records = [];
+        let start = 0;
+        while (start < csvText.length) {
+            let scan = this._scanCSVRecord(csvText, start, true);
+            if (scan.unterminated) {
+                // An unclosed quote would swallow the rest of the text; confine
+                // this record to its own line so the records after it survive
+                scan = this._scanCSVRecord(csvText, start, false);
+            }
+            records.push(scan.record);
+            start = scan.next;
+        }
+        return records;
+    }
+
+    /**
+     * Scans one CSV record starting at the given offset
+     * @param {string} csvText - Raw CSV text
+     * @param {number} start - Offset of the first character of the record
+     * @param {boolean} multiline - Whether quoted fields may continue past a line break
+     * @returns {Object} The record's field values, the offset of the next record,
+     *     and whether a quoted field was still open at the end of the text
      */
-    static parseCSVLine(line) {
-        const result = [];
-        let current = '';
+    static _scanCSVRecord(csvText, start, multiline) {
+        const record = [];
+        let field = '';
         let inQuotes = false;
-        for (let i = 0; i < line.length; i++) {
-            const char = line[i];
-            if (char === '"') {
-                if (i + 1 < line.length && line[i + 1] === '"') {
-                    current += '"';
+        const length = csvText.length;
+
+        for (let i = start; i < length; i++) {
+            const char = csvText[i];
+            const lineBreak = char === '\n' || (char === '\r' && csvText[i + 1] === '\n');
+
+            if (inQuotes && (multiline || !lineBreak)) {
+                if (char !== '"') {
+                    field += char;
+                } else if (csvText[i + 1] === '"') {
+                    field += '"';
                     i++;
                 } else {
-                    inQuotes = !inQuotes;
+                    inQuotes = false;
                 }
-            } else if (char === ',' && !inQuotes) {
-                result.push(current);
-                current = '';
+            } else if (lineBreak) {
+                record.push(field);
+                return { record, next: char === '\r' ? i + 2 : i + 1, unterminated: false };
+            } else if (char === '"' && field.trim() === '') {
+                // Only a quote at the start of a field (after optional whitespace) opens
+                // a quoted section; a stray quote elsewhere is kept as a literal character
+                inQuotes = true;
+                field = '';
+            } else if (char === ',') {
+                record.push(field);
+                field = '';
             } else {
-                current += char;
+                field += char;
             }
         }
-        result.push(current);
-        return result;
+
+        record.push(field);
+        return { record, next: length, unterminated: inQuotes };
     }
 
     /**
@@ -190,12 +254,7 @@ export class GeoUtils {
      */
     static escapeXml(unsafe) {
         if (!unsafe) return '';
-        return unsafe.toString()
-            .replace(/&/g, '&amp;')
-            .replace(/</g, '&lt;')
-            .replace(/>/g, '&gt;')
-            .replace(/"/g, '&quot;')
-            .replace(/'/g, '&apos;');
+        return unsafe.toString().replace(XML_SPECIAL_CHARS_RE, char => XML_ESCAPES[char]);
     }
 
     /**
@@ -298,7 +357,7 @@ export class GeoUtils {
             if (typeof value === 'number') return value;
             if (typeof value === 'string') {
                 value = value.replace(',', '.');
-                const match = value.match(/-?\d+(\.\d+)?/);
+                const match = value.match(COORDINATE_RE);
                 if (match) return parseFloat(match[0]);
             }
             return parseFloat(value);
@@ -307,27 +366,32 @@ export class GeoUtils {
         const parsePropertyValue = (value) => {
             if (value === null || value === undefined || value === '') return value;
             if (typeof value !== 'string') return value;
-            if (value.toLowerCase() === 'true') return true;
-            if (value.toLowerCase() === 'false') return false;
-            if (/^-?\d+$/.test(value)) return parseInt(value, 10);
-            if (/^-?\d+\.\d+$/.test(value)) return parseFloat(value);
-            if (/^-?\d+,\d+$/.test(value)) return parseFloat(value.replace(',', '.'));
-            return value;
+            const valueLower = value.toLowerCase();
+            if (valueLower === 'true') return true;
+            if (valueLower === 'false') return false;
+            const numeric = NUMERIC_RE.exec(value);
+            if (!numeric) return value;
+            if (!numeric[1]) return parseInt(value, 10);
+            return parseFloat(numeric[1] === ',' ? value.replace(',', '.') : value);
         };
 
         const features = [];
         rows.forEach((row) => {
             if (!(lonField in row) || !(latField in row)) return;
-            const lon = parseCoordinate(row[lonField]);
-            const lat = parseCoordinate(row[latField]);
-            if (isNaN(lon) || isNaN(lat)) return;
-            if (lon < -180 || lon > 180 || lat < -90 || lat > 90) return;
 
             const parsedProperties = {};
             for (const [key, value] of Object.entries(row)) {
                 parsedProperties[key] = parsePropertyValue(value);
             }
 
+            // Plain numeric cells are already converted above; only clean up the rest
+            const parsedLon = parsedProperties[lonField];
+            const parsedLat = parsedProperties[latField];
+            const lon = typeof parsedLon === 'number' ? parsedLon : parseCoordinate(row[lonField]);
+            const lat = typeof parsedLat === 'number' ? parsedLat : parseCoordinate(row[latField]);
+            if (isNaN(lon) || isNaN(lat)) return;
+            if (lon < -180 || lon > 180 || lat < -90 || lat > 90) return;
+
             features.push({
                 type: 'Feature',
                 geometry: { type: 'Point', coordinates: [lon, lat] },
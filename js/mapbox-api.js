@@ -1764,13 +1764,12 @@ export class MapboxAPI {
         if (!this._map.getSource(sourceId) && visible) {
             try {
                 let geojson;
+                let csvText = null;
 
                 if (config.data) {
                     geojson = this._processCSVData(config.data, config.csvParser);
                 } else if (config.url) {
-                    const response = await fetch(config.url);
-                    const csvText = await response.text();
-                    geojson = this._processCSVData(csvText, config.csvParser);
+                    ({ csvText, geojson } = await this._fetchCSVData(config));
                 } else {
                     console.error('CSV layer missing both data and URL:', groupId);
                     return false;
@@ -1796,7 +1795,7 @@ export class MapboxAPI {
 
                 // Set up refresh if specified
                 if (config.refresh && config.url) {
-                    this._setupCSVRefresh(groupId, config);
+                    this._setupCSVRefresh(groupId, config, csvText);
                 }
             } catch (error) {
                 console.error(`Error loading CSV layer '${groupId}':`, error);
@@ -1821,11 +1820,22 @@ export class MapboxAPI {
         return GeoUtils.rowsToGeoJSON(rows);
     }
 
-    _setupCSVRefresh(groupId, config) {
+    async _fetchCSVData(config, previousText = null) {
+        const response = await fetch(config.url);
+        const csvText = await response.text();
+        // Unchanged text would parse to the same GeoJSON, so skip the work
+        if (csvText === previousText) {
+            return { csvText, changed: false, geojson: null };
+        }
+        return { csvText, changed: true, geojson: this._processCSVData(csvText, config.csvParser) };
+    }
+
+    _setupCSVRefresh(groupId, config, initialCsvText = null) {
         if (this._refreshTimers.has(groupId)) {
             clearInterval(this._refreshTimers.get(groupId));
         }
 
+        let lastCsvText = initialCsvText;
         const timer = setInterval(async () => {
             const sourceId = `csv-${groupId}`;
             if (!this._map.getSource(sourceId)) {
@@ -1835,10 +1845,11 @@ export class MapboxAPI {
             }
 
             try {
-                const response = await fetch(config.url);
-                const csvText = await response.text();
-                const geojson = this._processCSVData(csvText, config.csvParser);
-                this._map.getSource(sourceId).setData(geojson);
+                const { csvText, changed, geojson } = await this._fetchCSVData(config, lastCsvText);
+                if (changed) {
+                    this._map.getSource(sourceId).setData(geojson);
+                    lastCsvText = csvText;
+                }
             } catch (error) {
                 console.error('Error refreshing CSV layer:', error);
             }
@@ -2640,22 +2651,23 @@ export class MapboxAPI {
             return userColor;
         }
 
-        // Clone the default style expression to avoid modifying the original
-        const result = JSON.parse(JSON.stringify(defaultStyleExpression));
-
-        // Handle different types of expressions
-        if (result[0] === 'case') {
-            // Simple case expression - replace the fallback color (last value)
+        // Handle different types of expressions, copying the default only as deep as it is modified
+        if (defaultStyleExpression[0] === 'case') {
+            // Simple case expression - replace the fallback color (last value) on a shallow copy
+            const result = [...defaultStyleExpression];
             result[result.length - 1] = userColor;
-        } else if (result[0] === 'interpolate' && result[2] && Array.isArray(result[2]) && result[2][0] === 'zoom') {
-            // Interpolate expression with zoom - replace fallback colors in nested case expressions
+            return result;
+        }
+
+        if (defaultStyleExpression[0] === 'interpolate' && defaultStyleExpression[2] && Array.isArray(defaultStyleExpression[2]) && defaultStyleExpression[2][0] === 'zoom') {
+            // Interpolate expression with zoom - nested case expressions are modified in place, so deep clone
+            const result = JSON.parse(JSON.stringify(defaultStyleExpression));
             this._replaceColorsInInterpolateExpression(result, userColor);
-        } else {
-            // For other expression types, return user color directly
-            return userColor;
+            return result;
         }
 
-        return result;
+        // For other expression types, return user color directly
+        return userColor;
     }
 
     /**
@@ -0,0 +1,16 @@
+import { describe, it, expect } from 'vitest';
+import { KMLConverter } from '../kml-converter.js';
+
+describe('KMLConverter', () => {
+    describe('_escapeXml', () => {
+        it('should escape all XML special characters', () => {
+            expect(KMLConverter._escapeXml(`Tom & Jerry's <"shop">`))
+                .toBe('Tom &amp; Jerry&apos;s &lt;&quot;shop&quot;&gt;');
+        });
+
+        it('should stringify non-string values, including falsy ones', () => {
+            expect(KMLConverter._escapeXml(0)).toBe('0');
+            expect(KMLConverter._escapeXml(false)).toBe('false');
+        });
+    });
+});
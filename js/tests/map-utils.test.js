@@ -0,0 +1,108 @@
+import { describe, it, expect } from 'vitest';
+import { DataUtils, GeoUtils } from '../map-utils.js';
+
+describe('DataUtils', () => {
+    describe('parseCSV', () => {
+        it('should return an empty array for empty input', () => {
+            expect(DataUtils.parseCSV('')).toEqual([]);
+            expect(DataUtils.parseCSV(null)).toEqual([]);
+            expect(DataUtils.parseCSV('\n\n')).toEqual([]);
+        });
+
+        it('should map rows to objects keyed by trimmed headers', () => {
+            const rows = DataUtils.parseCSV(' name , lat,lon\nStation,15.5,73.8\n');
+            expect(rows).toEqual([{ name: 'Station', lat: '15.5', lon: '73.8' }]);
+        });
+
+        it('should handle quoted fields with commas and escaped quotes', () => {
+            const rows = DataUtils.parseCSV('name,note\n"Panaji, Goa","He said ""hi"""\nEmpty,""');
+            expect(rows).toEqual([
+                { name: 'Panaji, Goa', note: 'He said "hi"' },
+                { name: 'Empty', note: '' }
+            ]);
+        });
+
+        it('should keep line breaks inside quoted fields', () => {
+            const rows = DataUtils.parseCSV('name,address\r\n"Fire Station","Line 1\r\nLine 2"\r\nDepot,Margao\r\n');
+            expect(rows).toEqual([
+                { name: 'Fire Station', address: 'Line 1\r\nLine 2' },
+                { name: 'Depot', address: 'Margao' }
+            ]);
+        });
+
+        it('should keep a stray quote inside an unquoted field on its own line', () => {
+            const rows = DataUtils.parseCSV('name,size\nPipe,5" diameter\nOther,3\nThird,4\n');
+            expect(rows).toEqual([
+                { name: 'Pipe', size: '5" diameter' },
+                { name: 'Other', size: '3' },
+                { name: 'Third', size: '4' }
+            ]);
+        });
+
+        it('should open a quoted field after leading whitespace and drop that whitespace', () => {
+            const rows = DataUtils.parseCSV('name,note\nA, "x, y"\nB,plain');
+            expect(rows).toEqual([
+                { name: 'A', note: 'x, y' },
+                { name: 'B', note: 'plain' }
+            ]);
+        });
+
+        it('should confine an unterminated quoted field to its own line', () => {
+            const rows = DataUtils.parseCSV('name,note\nA,"unterminated\nB,2\nC,3');
+            expect(rows).toEqual([
+                { name: 'A', note: 'unterminated' },
+                { name: 'B', note: '2' },
+                { name: 'C', note: '3' }
+            ]);
+        });
+
+        it('should skip blank lines, repeated headers and malformed rows', () => {
+            const rows = DataUtils.parseCSV('a,b\na,b\n\n1,2\n3,4,5\n6,7');
+            expect(rows).toEqual([{ a: '1', b: '2' }, { a: '6', b: '7' }]);
+        });
+    });
+});
+
+describe('GeoUtils', () => {
+    describe('escapeXml', () => {
+        it('should escape all XML special characters', () => {
+            expect(GeoUtils.escapeXml(`Tom & Jerry's <"shop">`))
+                .toBe('Tom &amp; Jerry&apos;s &lt;&quot;shop&quot;&gt;');
+        });
+
+        it('should escape & inside existing entities', () => {
+            expect(GeoUtils.escapeXml('&amp;')).toBe('&amp;amp;');
+        });
+
+        it('should return an empty string for empty values', () => {
+            expect(GeoUtils.escapeXml(null)).toBe('');
+            expect(GeoUtils.escapeXml('')).toBe('');
+        });
+    });
+
+    describe('rowsToGeoJSON', () => {
+        it('should detect coordinate fields and type property values', () => {
+            const geojson = GeoUtils.rowsToGeoJSON([
+                { name: 'A', latitude: '15.5', longitude: '73,8', count: '3', active: 'TRUE', depth: '1,5' }
+            ]);
+            expect(geojson.features).toHaveLength(1);
+            expect(geojson.features[0].geometry.coordinates).toEqual([73.8, 15.5]);
+            expect(geojson.features[0].properties).toEqual({
+                name: 'A', latitude: 15.5, longitude: 73.8, count: 3, active: true, depth: 1.5
+            });
+        });
+
+        it('should drop rows with missing or out of range coordinates', () => {
+            const geojson = GeoUtils.rowsToGeoJSON([
+                { lat: 'n/a', lon: '73.8' },
+                { lat: '95', lon: '73.8' },
+                { lat: '15.5', lon: '73.8' }
+            ]);
+            expect(geojson.features).toHaveLength(1);
+        });
+
+        it('should return null when no coordinate fields are found', () => {
+            expect(GeoUtils.rowsToGeoJSON([{ name: 'A' }])).toBeNull();
+        });
+    });
+});